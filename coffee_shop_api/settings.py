@@ -145,6 +145,10 @@ CACHES = {
 }
 
 
+# Max rows touched per UPDATE/DELETE statement by the bulk user endpoints
+USER_BULK_CHUNK_SIZE = max(1, int(os.getenv("USER_BULK_CHUNK_SIZE", "1000")))
+
+
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
 CELERY_TIMEZONE = "UTC"
@@ -27,4 +27,54 @@ class VerifySerializer(serializers.Serializer):
 
 class ResendCodeSerializer(serializers.Serializer):
     """Serializer for resending verification code."""
-    email = serializers.EmailField(help_text="User email to resend verification code.")
\ No newline at end of file
+    email = serializers.EmailField(help_text="User email to resend verification code.")
+
+class StrictSerializer(serializers.Serializer):
+    """Rejects unknown keys instead of silently dropping them."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, dict):
+            unknown = sorted(set(data) - set(self.fields))
+            if unknown:
+                raise serializers.ValidationError({key: ["Unknown field."] for key in unknown})
+        return super().to_internal_value(data)
+
+
+class BulkUserFilterSerializer(StrictSerializer):
+    """Whitelisted lookups accepted by the bulk user endpoints."""
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES, required=False)
+    is_verified = serializers.BooleanField(required=False)
+    is_active = serializers.BooleanField(required=False)
+    email__iendswith = serializers.CharField(required=False, help_text="Email suffix, e.g. '@spam.example'.")
+    date_joined__gte = serializers.DateTimeField(required=False)
+    date_joined__lt = serializers.DateTimeField(required=False)
+
+
+class BulkUserSelectSerializer(StrictSerializer):
+    """Selects users by an explicit `ids` list and/or a `filter` expression."""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        help_text="User IDs to act on.",
+    )
+    filter = BulkUserFilterSerializer(required=False, help_text="Lookups combined with AND.")
+
+    def validate(self, attrs):
+        if not attrs.get("ids") and not attrs.get("filter"):
+            raise serializers.ValidationError("Provide `ids` or a non-empty `filter`.")
+        return attrs
+
+
+class BulkUserUpdateSerializer(BulkUserSelectSerializer):
+    UPDATE_FIELDS = ("role", "is_verified", "is_active")
+
+    role = serializers.ChoiceField(choices=User.ROLE_CHOICES, required=False)
+    is_verified = serializers.BooleanField(required=False)
+    is_active = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if not any(field in attrs for field in self.UPDATE_FIELDS):
+            raise serializers.ValidationError("Provide at least one of `role`, `is_verified`, `is_active`.")
+        return attrs
@@ -1,13 +1,34 @@
+import threading
+from contextlib import contextmanager
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.cache import cache
 from .models import User
 
+_state = threading.local()
+
+
+@contextmanager
+def user_cache_signals_suspended():
+    """
+    Skip per-row cache clearing inside the block (used by bulk operations,
+    which clear the cache once when they are done).
+    """
+    previous = getattr(_state, "suspended", False)
+    _state.suspended = True
+    try:
+        yield
+    finally:
+        _state.suspended = previous
+
+
 @receiver([post_save, post_delete], sender=User)
 def clear_user_cache(sender, **kwargs):
     """
     Automatically clear the Redis cache whenever a User is created, updated, or deleted.
     """
+    if getattr(_state, "suspended", False):
+        return
     cache_key = "cached_users"
     cache.delete(cache_key)
     print("🧹 User cache cleared due to change in User model!")
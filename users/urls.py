@@ -1,5 +1,8 @@
 from django.urls import path
-from .views import RegisterView, VerifyView, LoginView, MeView, UserListView, UserDetailView, ResendVerificationCodeView
+from .views import (
+    RegisterView, VerifyView, LoginView, MeView, UserListView, UserDetailView, ResendVerificationCodeView,
+    UserBulkUpdateView, UserBulkDeleteView,
+)
 from rest_framework_simplejwt.views import TokenRefreshView
 
 urlpatterns = [
@@ -10,5 +13,7 @@ urlpatterns = [
     path("auth/refresh/", TokenRefreshView.as_view(), name="auth-refresh"),
     path("me/", MeView.as_view(), name="me"),
     path("users/", UserListView.as_view(), name="users-list"),
+    path("users/bulk-update/", UserBulkUpdateView.as_view(), name="users-bulk-update"),
+    path("users/bulk-delete/", UserBulkDeleteView.as_view(), name="users-bulk-delete"),
     path("users/<int:pk>/", UserDetailView.as_view(), name="users-detail"),
 ]
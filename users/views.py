@@ -5,7 +5,10 @@ from datetime import timedelta
 import random
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import User
-from .serializers import RegisterSerializer, UserSerializer, VerifySerializer, LoginSerializer, ResendCodeSerializer
+from .serializers import (
+    RegisterSerializer, UserSerializer, VerifySerializer, LoginSerializer, ResendCodeSerializer,
+    BulkUserSelectSerializer, BulkUserUpdateSerializer,
+)
 from .permissions import IsAdminRole
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -13,6 +16,9 @@ from rest_framework.views import APIView
 from .tasks import send_verification_email
 from rest_framework.pagination import PageNumberPagination
 from django.core.cache import cache
+from django.conf import settings
+from django.db import transaction
+from .signals import clear_user_cache, user_cache_signals_suspended
 
 class RegisterView(generics.CreateAPIView):
     """
@@ -215,3 +221,126 @@ class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAdminRole]
+
+
+def _chunks(ids):
+    size = settings.USER_BULK_CHUNK_SIZE
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def _selected_user_ids(validated_data, request):
+    """
+    Resolve the bulk selection (ids AND filter) to a sorted list of primary keys.
+    The requesting user is never selected; returns (ids, skipped).
+    """
+    qs = User.objects.all()
+    if validated_data.get("filter"):
+        qs = qs.filter(**validated_data["filter"])
+
+    skipped = []
+    if qs.filter(pk=request.user.pk).exists() and (
+        not validated_data.get("ids") or request.user.pk in validated_data["ids"]
+    ):
+        skipped.append({"id": request.user.pk, "reason": "Requesting user is excluded from bulk actions"})
+    qs = qs.exclude(pk=request.user.pk).order_by("pk")
+
+    if not validated_data.get("ids"):
+        return list(qs.values_list("pk", flat=True)), skipped
+
+    # Resolve explicit ids chunk by chunk to stay under the database's parameter limit
+    ids = []
+    for chunk in _chunks(sorted(set(validated_data["ids"]))):
+        ids.extend(qs.filter(pk__in=chunk).values_list("pk", flat=True))
+    return ids, skipped
+
+
+class UserBulkUpdateView(generics.GenericAPIView):
+    """
+    Admin-only. Set `role` / `is_verified` / `is_active` on many users at once.
+    Runs one UPDATE per chunk inside a single transaction and clears the
+    user cache once at the end. The requesting user is always skipped.
+    """
+    serializer_class = BulkUserUpdateSerializer
+    permission_classes = [IsAdminRole]
+
+    @swagger_auto_schema(
+        operation_summary="Bulk update users",
+        operation_description=(
+            "Select users with `ids` and/or `filter` and set any of "
+            "`role`, `is_verified`, `is_active` on all of them. "
+            "The requesting user is never changed."
+        ),
+        request_body=BulkUserUpdateSerializer,
+        responses={
+            200: openapi.Response(description="Summary of affected rows"),
+            400: openapi.Response(description="Invalid selection or changes"),
+        },
+    )
+    def patch(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        changes = {field: data[field] for field in BulkUserUpdateSerializer.UPDATE_FIELDS if field in data}
+
+        updated = 0
+        with transaction.atomic():
+            ids, skipped = _selected_user_ids(data, request)
+
+            for chunk in _chunks(ids):
+                updated += User.objects.filter(pk__in=chunk).update(**changes)
+
+        if updated:
+            transaction.on_commit(lambda: clear_user_cache(User))
+
+        return Response(
+            {"matched": len(ids), "updated": updated, "changes": changes, "skipped": skipped},
+            status=status.HTTP_200_OK,
+        )
+
+
+class UserBulkDeleteView(generics.GenericAPIView):
+    """
+    Admin-only. Delete many users at once, chunk by chunk inside a single transaction.
+    Each chunk goes through Django's regular delete: the User rows are loaded,
+    related rows (groups, permissions, admin log, JWT tokens) are handled and
+    post_delete is sent per user. The per-user cache clearing is suspended and
+    the user cache is cleared once at the end. The requesting user is always
+    skipped.
+    """
+    serializer_class = BulkUserSelectSerializer
+    permission_classes = [IsAdminRole]
+
+    @swagger_auto_schema(
+        operation_summary="Bulk delete users",
+        operation_description=(
+            "Delete every user matched by `ids` and/or `filter`. "
+            "The requesting user is never deleted."
+        ),
+        request_body=BulkUserSelectSerializer,
+        responses={
+            200: openapi.Response(description="Summary of deleted rows"),
+            400: openapi.Response(description="Invalid selection"),
+        },
+    )
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        details = {}
+        with transaction.atomic(), user_cache_signals_suspended():
+            ids, skipped = _selected_user_ids(serializer.validated_data, request)
+
+            for chunk in _chunks(ids):
+                _, per_model = User.objects.filter(pk__in=chunk).delete()
+                for label, count in per_model.items():
+                    details[label] = details.get(label, 0) + count
+
+        deleted = details.get(User._meta.label, 0)
+        if deleted:
+            transaction.on_commit(lambda: clear_user_cache(User))
+
+        return Response(
+            {"matched": len(ids), "deleted": deleted, "details": details, "skipped": skipped},
+            status=status.HTTP_200_OK,
+        )